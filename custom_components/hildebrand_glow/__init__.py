@@ -18,17 +18,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import HildebrandGlowEnergyMonitorApiClient
-from .const import DEFAULT_UPDATE_INTERVAL_MINUTES, DOMAIN, LOGGER
-from .coordinator import HildebrandGlowEnergyMonitorDataUpdateCoordinator
+from .const import DEFAULT_UPDATE_INTERVAL_MINUTES, DOMAIN, LOGGER, TOKEN_STORAGE_VERSION, UPDATE_INTERVAL_HISTORICAL
+from .coordinator import HildebrandGlowEnergyMonitorDailyCoordinator, HildebrandGlowEnergyMonitorHistoricalCoordinator
 from .data import HildebrandGlowEnergyMonitorData
 from .service_actions import async_setup_services
 
@@ -80,7 +82,7 @@ async def async_setup_entry(
 
     This is called when a config entry is loaded. It:
     1. Creates the API client with credentials from the config entry
-    2. Initializes the DataUpdateCoordinator for data fetching
+    2. Initializes the daily and historical DataUpdateCoordinators for data fetching
     3. Performs the first data refresh
     4. Sets up all platforms (sensors, switches, etc.)
     5. Registers services
@@ -106,35 +108,51 @@ async def async_setup_entry(
     For more information:
     https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
     """
-    # Initialize client first
+    # Initialize client first, using Home Assistant's shared session so
+    # keep-alive connections to the Glowmarkt API are reused between polls
     client = HildebrandGlowEnergyMonitorApiClient(
         username=entry.data[CONF_USERNAME],  # From config flow setup
         password=entry.data[CONF_PASSWORD],  # From config flow setup
         session=async_get_clientsession(hass),
+        token_store=_async_get_token_store(hass, entry),
     )
 
     # Get update interval from options (or use default)
     update_interval_minutes = entry.options.get("update_interval_minutes", DEFAULT_UPDATE_INTERVAL_MINUTES)
 
-    # Initialize coordinator with config_entry
-    coordinator = HildebrandGlowEnergyMonitorDataUpdateCoordinator(
+    # Initialize coordinators with config_entry: today's data follows the configured
+    # interval, while week/month totals and tariffs only need refreshing hourly
+    coordinator = HildebrandGlowEnergyMonitorDailyCoordinator(
         hass=hass,
         logger=LOGGER,
-        name=DOMAIN,
+        name=f"{DOMAIN}_daily",
         config_entry=entry,
         update_interval=timedelta(minutes=update_interval_minutes),
         always_update=False,  # Only update entities when data actually changes
     )
+    historical_coordinator = HildebrandGlowEnergyMonitorHistoricalCoordinator(
+        hass=hass,
+        logger=LOGGER,
+        name=f"{DOMAIN}_historical",
+        config_entry=entry,
+        update_interval=timedelta(minutes=UPDATE_INTERVAL_HISTORICAL),
+        always_update=False,
+    )
 
     # Store runtime data
     entry.runtime_data = HildebrandGlowEnergyMonitorData(
         client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        historical_coordinator=historical_coordinator,
     )
 
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    # The two scopes are independent, so their first refreshes overlap
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        historical_coordinator.async_config_entry_first_refresh(),
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -168,6 +186,33 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: HildebrandGlowEnergyMonitorConfigEntry,
+) -> None:
+    """
+    Clean up when a config entry is removed.
+
+    Deletes the saved API token so it does not outlive the entry.
+
+    Args:
+        hass: The Home Assistant instance.
+        entry: The config entry being removed.
+
+    For more information:
+    https://developers.home-assistant.io/docs/config_entries_index/#removal-of-entries
+    """
+    await _async_get_token_store(hass, entry).async_remove()
+
+
+def _async_get_token_store(
+    hass: HomeAssistant,
+    entry: HildebrandGlowEnergyMonitorConfigEntry,
+) -> Store[dict[str, Any]]:
+    """Return the store holding the API token for a config entry."""
+    return Store(hass, TOKEN_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.token")
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: HildebrandGlowEnergyMonitorConfigEntry,
@@ -176,7 +221,8 @@ async def async_reload_entry(
     Handle config entry options update.
 
     This is called when the integration options have changed.
-    For update_interval changes, we update the coordinator directly.
+    For update_interval changes, we update the daily coordinator directly;
+    the historical coordinator keeps its fixed hourly interval.
     For other changes, we reload the full integration.
 
     Args:
@@ -10,13 +10,69 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable
 from datetime import UTC, datetime, timedelta
+from functools import cache
+import random
 import socket
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import aiohttp
 
-from custom_components.hildebrand_glow.const import API_URL, APPLICATION_ID, LOGGER
+# Response bodies are decoded straight from bytes, which both loaders accept,
+# skipping the intermediate str that ClientResponse.json() builds
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
+
+from custom_components.hildebrand_glow.const import (
+    API_URL,
+    APPLICATION_ID,
+    LOGGER,
+    PERIOD_DAY,
+    PERIOD_HOUR,
+    PERIOD_MINUTE,
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+    SCOPE_DAILY,
+    SCOPE_HISTORICAL,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.storage import Store
+
+# Readings endpoint, formatted with the resource ID
+_READINGS_ENDPOINT = "resource/{}/readings"
+
+
+@cache
+def _reading_key(classifier: str, period: str) -> str:
+    """
+    Return the readings key for a classifier and window, e.g. electricity.consumption_today.
+
+    Keys are cached and interned so every poll stores readings under the same
+    string objects the coordinator looks them up with.
+    """
+    return sys.intern(f"{classifier}_{period}")
+
+
+# Fallback query period for each reading window
+_WINDOW_PERIODS = {
+    "today": PERIOD_DAY,
+    "week": PERIOD_WEEK,
+    "month": PERIOD_MONTH,
+}
+
+# Length of each readings period, used to tell whether a point is still in progress
+_PERIOD_SECONDS = {
+    PERIOD_MINUTE: 60,
+    PERIOD_HOUR: 60 * 60,
+    PERIOD_DAY: 24 * 60 * 60,
+    PERIOD_WEEK: 7 * 24 * 60 * 60,
+    PERIOD_MONTH: 31 * 24 * 60 * 60,
+}
 
 
 class HildebrandGlowEnergyMonitorApiClientError(Exception):
@@ -35,6 +91,20 @@ class HildebrandGlowEnergyMonitorApiClientAuthenticationError(
     """Exception to indicate an authentication error with the API."""
 
 
+class ResourceSpec(NamedTuple):
+    """Metadata of a meter resource, resolved once per poll."""
+
+    id: str
+    classifier: str
+    is_consumption: bool
+
+    @classmethod
+    def from_resource(cls, resource: dict[str, Any]) -> ResourceSpec:
+        """Create a spec from a resource dictionary returned by the API."""
+        classifier = resource.get("classifier", "")
+        return cls(resource["resourceId"], classifier, "cost" not in classifier)
+
+
 class HildebrandGlowEnergyMonitorApiClient:
     """
     API Client for Glowmarkt/Hildebrand Glow energy monitoring.
@@ -47,19 +117,67 @@ class HildebrandGlowEnergyMonitorApiClient:
         _username: The username (email) for Glowmarkt account.
         _password: The password for Glowmarkt account.
         _session: The aiohttp ClientSession for making requests.
+        _owns_session: Whether the client created the session and must close it.
         _token: The authentication token from the API.
         _token_expiry: When the token expires (UTC).
+        _token_refresh_at: When the token should be refreshed (UTC).
+        _auth_headers: Headers for authenticated requests, updated in place on refresh.
+        _request_semaphore: Limits the number of concurrent API requests.
+        _auth_lock: Serializes token refreshes across concurrent requests.
+        _token_store: Optional store used to persist the token across restarts.
+        _token_loaded: Whether the stored token has been loaded.
+        _etags: Last ETag and decoded body for each read-only endpoint requested conditionally.
 
     """
 
+    # The client lives as long as the config entry and is hit on every poll
+    __slots__ = (
+        "_auth_headers",
+        "_auth_lock",
+        "_etags",
+        "_owns_session",
+        "_password",
+        "_request_semaphore",
+        "_session",
+        "_token",
+        "_token_expiry",
+        "_token_loaded",
+        "_token_refresh_at",
+        "_token_store",
+        "_username",
+    )
+
     # Token validity period (Glowmarkt tokens typically last 1 hour, refresh 5 min before)
     TOKEN_LIFETIME_SECONDS = 55 * 60  # 55 minutes
+    # Consider the token expired if less than this remains
+    TOKEN_REFRESH_MARGIN = timedelta(minutes=1)
+
+    # Upper bound on in-flight requests, keeps concurrent fetches within Glowmarkt rate limits
+    MAX_CONCURRENT_REQUESTS = 8
+
+    AUTH_TIMEOUT = 10  # seconds
+
+    # Transient failures are retried within a request with exponential backoff
+    RETRY_ATTEMPTS = 3
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    RETRY_ATTEMPT_TIMEOUT = 8  # seconds
+    RETRY_BACKOFF = 0.5  # seconds, doubled after each failed attempt
+    RETRY_JITTER = 0.2  # seconds, upper bound of the random delay added to each backoff
+    # Longest a retry loop can run: every attempt times out and is followed by a backoff
+    RETRY_LOOP_TIMEOUT = (
+        RETRY_ATTEMPTS * RETRY_ATTEMPT_TIMEOUT
+        + RETRY_BACKOFF * (2 ** (RETRY_ATTEMPTS - 1) - 1)
+        + RETRY_JITTER * (RETRY_ATTEMPTS - 1)
+    )
+    # A request that gets a 401 runs a retry loop, re-authenticates and runs a second loop
+    REQUEST_TIMEOUT = 2 * RETRY_LOOP_TIMEOUT + AUTH_TIMEOUT
 
     def __init__(
         self,
         username: str,
         password: str,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None = None,
+        token_store: Store[dict[str, Any]] | None = None,
     ) -> None:
         """
         Initialize the API Client with credentials.
@@ -67,14 +185,55 @@ def __init__(
         Args:
             username: The username (email) for Glowmarkt account.
             password: The password for Glowmarkt account.
-            session: The aiohttp ClientSession to use for requests.
+            session: The aiohttp ClientSession to use for requests. Inside Home
+                Assistant this must be the shared session from
+                async_get_clientsession so connections to the API are pooled.
+                When omitted (use outside Home Assistant) the client creates a
+                dedicated session on first use; close it with async_close.
+            token_store: Optional Home Assistant store used to keep the token
+                across restarts. When omitted the token is only held in memory.
 
         """
         self._username = username
         self._password = password
+        # Keep one session for the lifetime of the client - do NOT create a
+        # session per request, that defeats keep-alive and repeats the TCP/TLS handshake
         self._session = session
+        self._owns_session = session is None
         self._token: str | None = None
         self._token_expiry: datetime | None = None
+        self._token_refresh_at: datetime | None = None
+        self._auth_headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "applicationId": APPLICATION_ID,
+            "token": "",
+        }
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._auth_lock = asyncio.Lock()
+        self._token_store = token_store
+        self._token_loaded = token_store is None
+        self._etags: dict[str, tuple[str, Any]] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating a dedicated one when none was provided."""
+        if self._session is None:
+            # Only ever talks to api.glowmarkt.com: a small pool, long-lived DNS
+            # entries and keep-alive outlasting the gap between coordinator polls
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONCURRENT_REQUESTS,
+                    limit_per_host=self.MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=120,
+                ),
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the session if it was created by this client."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def async_authenticate(self) -> str:
         """
@@ -90,8 +249,8 @@ async def async_authenticate(self) -> str:
         """
         try:
             LOGGER.debug("Authenticating with Glowmarkt API for user: %s", self._username)
-            async with asyncio.timeout(10):
-                response = await self._session.post(
+            async with asyncio.timeout(self.AUTH_TIMEOUT):
+                response = await self._get_session().post(
                     f"{API_URL}/auth",
                     headers={
                         "Content-Type": "application/json",
@@ -110,7 +269,7 @@ async def async_authenticate(self) -> str:
                     raise HildebrandGlowEnergyMonitorApiClientAuthenticationError(msg)  # noqa: TRY301
 
                 response.raise_for_status()
-                data = await response.json()
+                data = json_loads(await response.read())
 
                 if not data.get("valid"):
                     msg = "Authentication failed: invalid response"
@@ -120,14 +279,15 @@ async def async_authenticate(self) -> str:
                 if not self._token:
                     msg = "Authentication failed: no token received"
                     raise HildebrandGlowEnergyMonitorApiClientAuthenticationError(msg)  # noqa: TRY301
+                self._auth_headers["token"] = self._token
 
                 # Set token expiry time
                 self._token_expiry = datetime.now(tz=UTC) + timedelta(seconds=self.TOKEN_LIFETIME_SECONDS)
+                self._token_refresh_at = self._token_expiry - self.TOKEN_REFRESH_MARGIN
                 LOGGER.debug(
                     "Authentication successful, token obtained (expires at %s)",
                     self._token_expiry.isoformat(),
                 )
-                return self._token
 
         except HildebrandGlowEnergyMonitorApiClientAuthenticationError:
             raise
@@ -137,27 +297,125 @@ async def async_authenticate(self) -> str:
         except (aiohttp.ClientError, socket.gaierror) as exception:
             msg = f"Communication error during authentication - {exception}"
             raise HildebrandGlowEnergyMonitorApiClientCommunicationError(msg) from exception
+        except ValueError as exception:
+            # Body was not JSON, e.g. an HTML error page from a proxy
+            msg = f"Invalid response during authentication - {exception}"
+            raise HildebrandGlowEnergyMonitorApiClientCommunicationError(msg) from exception
+
+        if self._token_store is not None:
+            # Saved outside the auth timeout; a storage failure only costs a login on the next restart
+            try:
+                await self._token_store.async_save(
+                    {
+                        "username": self._username,
+                        "token": self._token,
+                        "expiry": self._token_expiry.isoformat(),
+                    }
+                )
+            except Exception:  # noqa: BLE001 - The token is valid even if it cannot be persisted
+                LOGGER.warning("Failed to save the authentication token", exc_info=True)
+        return self._token
 
-    def _is_token_expired(self) -> bool:
-        """Check if the current token is expired or about to expire."""
-        if not self._token or not self._token_expiry:
+    async def _async_load_token(self) -> None:
+        """Restore a token saved by a previous run, if it belongs to this user."""
+        self._token_loaded = True
+        if self._token_store is None:
+            return
+
+        stored = await self._token_store.async_load()
+        if not stored or stored.get("username") != self._username:
+            return
+
+        try:
+            token_expiry = datetime.fromisoformat(stored["expiry"])
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("Ignoring saved token with invalid expiry")
+            return
+
+        self._token = stored.get("token")
+        self._auth_headers["token"] = self._token or ""
+        self._token_expiry = token_expiry
+        self._token_refresh_at = token_expiry - self.TOKEN_REFRESH_MARGIN
+        LOGGER.debug("Restored saved token (expires at %s)", token_expiry.isoformat())
+
+    def _is_token_expired(self, now: datetime | None = None) -> bool:
+        """
+        Check if the current token is expired or about to expire.
+
+        Args:
+            now: Optional current time (UTC) to reuse an existing snapshot.
+
+        """
+        if not self._token or self._token_refresh_at is None:
             return True
-        # Consider expired if less than 1 minute remaining
-        return datetime.now(tz=UTC) >= self._token_expiry - timedelta(minutes=1)
+        return (now or datetime.now(tz=UTC)) >= self._token_refresh_at
 
     async def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid authentication token."""
-        if self._is_token_expired():
-            LOGGER.debug("Token missing or expired, authenticating...")
-            await self.async_authenticate()
+        """
+        Ensure we have a valid authentication token.
+
+        Concurrent callers share a single refresh: the first one to take the
+        lock authenticates and the rest reuse the token it obtained.
+        """
+        if not self._is_token_expired():
+            return
+        async with self._auth_lock:
+            if not self._token_loaded:
+                await self._async_load_token()
+            if self._is_token_expired():
+                LOGGER.debug("Token missing or expired, authenticating...")
+                await self.async_authenticate()
 
     def _get_auth_headers(self) -> dict[str, str]:
-        """Get headers with authentication token."""
-        return {
-            "Content-Type": "application/json",
-            "applicationId": APPLICATION_ID,
-            "token": self._token or "",
-        }
+        """Get a copy of the headers with authentication token."""
+        return dict(self._auth_headers)
+
+    def _request_headers(self, cached: tuple[str, Any] | None) -> dict[str, str]:
+        """Return the headers for a request, conditional on a cached ETag if there is one."""
+        if cached is None:
+            return self._auth_headers
+        return {**self._auth_headers, "If-None-Match": cached[0]}
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        """
+        Send a request, retrying transient gateway errors and dropped connections.
+
+        502/503/504 responses, server disconnects and attempts that time out
+        are retried with exponential backoff and jitter. Any other response,
+        including 401/403, is returned to the caller unchanged.
+
+        Args:
+            method: HTTP method (get, post, etc.).
+            url: Full request URL.
+            **kwargs: Additional arguments for ClientSession.request.
+
+        Returns:
+            The response of the last attempt.
+
+        """
+        attempt = 0
+        while True:
+            last_attempt = attempt == self.RETRY_ATTEMPTS - 1
+            try:
+                async with asyncio.timeout(self.RETRY_ATTEMPT_TIMEOUT):
+                    response = await self._get_session().request(method, url, **kwargs)
+            except (TimeoutError, aiohttp.ServerDisconnectedError, aiohttp.ClientOSError) as exception:
+                if last_attempt:
+                    raise
+                LOGGER.debug("Request to %s failed (%s), retrying", url, exception)
+            else:
+                if last_attempt or response.status not in self.RETRY_STATUSES:
+                    return response
+                LOGGER.debug("Request to %s returned %s, retrying", url, response.status)
+                response.release()
+
+            await asyncio.sleep(self.RETRY_BACKOFF * 2**attempt + random.random() * self.RETRY_JITTER)
+            attempt += 1
 
     async def _api_request(
         self,
@@ -165,6 +423,8 @@ async def _api_request(
         endpoint: str,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
+        *,
+        conditional: bool = False,
     ) -> Any:
         """
         Make an authenticated API request.
@@ -174,6 +434,10 @@ async def _api_request(
             endpoint: API endpoint path.
             params: Optional query parameters.
             data: Optional request body data.
+            conditional: Send the last ETag for the endpoint and reuse the cached
+                body when the server answers 304. Only for read-only GETs
+                without query parameters, never for endpoints that trigger
+                an action.
 
         Returns:
             The JSON response from the API.
@@ -184,44 +448,60 @@ async def _api_request(
             HildebrandGlowEnergyMonitorApiClientError: For other API errors.
 
         """
-        await self._ensure_authenticated()
-
-        try:
-            LOGGER.debug("API request: %s %s params=%s", method.upper(), endpoint, params)
-            async with asyncio.timeout(30):
-                response = await self._session.request(
-                    method=method,
-                    url=f"{API_URL}/{endpoint}",
-                    headers=self._get_auth_headers(),
-                    params=params,
-                    json=data,
-                )
+        # Cheap check first so the common warm-token case skips the extra coroutine
+        if self._is_token_expired():
+            await self._ensure_authenticated()
 
-                LOGGER.debug("API response status: %s for %s", response.status, endpoint)
+        cached = self._etags.get(endpoint) if conditional else None
 
-                if response.status in (401, 403):
-                    # Token may have expired, try re-authenticating
-                    LOGGER.debug("Token expired, re-authenticating...")
-                    self._token = None
-                    await self.async_authenticate()
-                    # Retry the request
-                    response = await self._session.request(
-                        method=method,
-                        url=f"{API_URL}/{endpoint}",
-                        headers=self._get_auth_headers(),
+        try:
+            async with self._request_semaphore:
+                LOGGER.debug("API request: %s %s params=%s", method.upper(), endpoint, params)
+                async with asyncio.timeout(self.REQUEST_TIMEOUT):
+                    request_token = self._auth_headers["token"]
+                    response = await self._request_with_retry(
+                        method,
+                        f"{API_URL}/{endpoint}",
+                        headers=self._request_headers(cached),
                         params=params,
                         json=data,
                     )
-                    if response.status in (401, 403):
-                        msg = "Authentication failed after token refresh"
-                        raise HildebrandGlowEnergyMonitorApiClientAuthenticationError(msg)  # noqa: TRY301
 
-                response.raise_for_status()
-                result = await response.json()
-                LOGGER.debug(
-                    "API response for %s: %s items", endpoint, len(result) if isinstance(result, list) else "dict"
-                )
-                return result
+                    LOGGER.debug("API response status: %s for %s", response.status, endpoint)
+
+                    if response.status in (401, 403):
+                        # Token may have expired, try re-authenticating
+                        LOGGER.debug("Token expired, re-authenticating...")
+                        if self._token == request_token:
+                            # Only drop the token this request used; another request may already have refreshed it
+                            self._token = None
+                        await self._ensure_authenticated()
+                        # Retry the request
+                        response.release()
+                        response = await self._request_with_retry(
+                            method,
+                            f"{API_URL}/{endpoint}",
+                            headers=self._request_headers(cached),
+                            params=params,
+                            json=data,
+                        )
+                        if response.status in (401, 403):
+                            msg = "Authentication failed after token refresh"
+                            raise HildebrandGlowEnergyMonitorApiClientAuthenticationError(msg)  # noqa: TRY301
+
+                    if response.status == 304 and cached is not None:
+                        response.release()
+                        LOGGER.debug("API response for %s not modified, reusing cached body", endpoint)
+                        return cached[1]
+
+                    response.raise_for_status()
+                    result = json_loads(await response.read())
+                    if conditional and (etag := response.headers.get("ETag")):
+                        self._etags[endpoint] = (etag, result)
+                    LOGGER.debug(
+                        "API response for %s: %s items", endpoint, len(result) if isinstance(result, list) else "dict"
+                    )
+                    return result
 
         except HildebrandGlowEnergyMonitorApiClientAuthenticationError:
             raise
@@ -231,6 +511,10 @@ async def _api_request(
         except (aiohttp.ClientError, socket.gaierror) as exception:
             msg = f"Communication error with {endpoint} - {exception}"
             raise HildebrandGlowEnergyMonitorApiClientCommunicationError(msg) from exception
+        except ValueError as exception:
+            # Body was not JSON, e.g. an HTML error page from a proxy
+            msg = f"Invalid response from {endpoint} - {exception}"
+            raise HildebrandGlowEnergyMonitorApiClientCommunicationError(msg) from exception
         except Exception as exception:
             msg = f"Unexpected error with {endpoint} - {exception}"
             raise HildebrandGlowEnergyMonitorApiClientError(msg) from exception
@@ -246,7 +530,7 @@ async def async_get_virtual_entities(self) -> list[dict[str, Any]]:
             - postalCode: Location postal code
 
         """
-        return await self._api_request("get", "virtualentity")
+        return await self._api_request("get", "virtualentity", conditional=True)
 
     async def async_get_resources(self, virtual_entity_id: str) -> list[dict[str, Any]]:
         """
@@ -263,7 +547,7 @@ async def async_get_resources(self, virtual_entity_id: str) -> list[dict[str, An
             - baseUnit: Unit of measurement (e.g., "kWh", "pence")
 
         """
-        response = await self._api_request("get", f"virtualentity/{virtual_entity_id}/resources")
+        response = await self._api_request("get", f"virtualentity/{virtual_entity_id}/resources", conditional=True)
         return response.get("resources", [])
 
     async def async_get_readings(
@@ -271,7 +555,7 @@ async def async_get_readings(
         resource_id: str,
         from_datetime: datetime,
         to_datetime: datetime,
-        period: str = "P1D",
+        period: str = PERIOD_DAY,
         function: str = "sum",
     ) -> dict[str, Any]:
         """
@@ -291,13 +575,91 @@ async def async_get_readings(
 
         """
         params = {
-            "from": from_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
-            "to": to_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
+            # Same YYYY-MM-DDTHH:MM:SS output as strftime, but isoformat is implemented in C
+            "from": from_datetime.replace(tzinfo=None).isoformat(timespec="seconds"),
+            "to": to_datetime.replace(tzinfo=None).isoformat(timespec="seconds"),
             "period": period,
             "function": function,
             "offset": "0",
         }
-        return await self._api_request("get", f"resource/{resource_id}/readings", params=params)
+        return await self._api_request("get", _READINGS_ENDPOINT.format(resource_id), params=params)
+
+    @staticmethod
+    def _aggregate_readings(readings: dict[str, Any], windows: dict[str, datetime]) -> dict[str, dict[str, Any]]:
+        """
+        Sum a readings series into totals for windows that end at the same time.
+
+        Args:
+            readings: Readings response covering the earliest window.
+            windows: Mapping of window name to its start datetime (UTC).
+
+        Returns:
+            Mapping of window name to a readings response whose data holds a
+            single [window start timestamp, total] pair, or no pairs when the
+            window has no readings. Empty when the series has no data.
+
+        """
+        data = readings.get("data")
+        if not data:
+            return {}
+
+        starts = [(name, start.timestamp()) for name, start in windows.items()]
+        totals = dict.fromkeys(windows, 0.0)
+        counts = dict.fromkeys(windows, 0)
+        for item in data:
+            if len(item) < 2 or item[1] is None:
+                continue
+            timestamp, value = item[0], item[1]
+            for name, start_timestamp in starts:
+                if timestamp >= start_timestamp:
+                    totals[name] += value
+                    counts[name] += 1
+
+        units = readings.get("units")
+        return {
+            name: {
+                "units": units,
+                "data": [[int(start_timestamp), totals[name]]] if counts[name] else [],
+            }
+            for name, start_timestamp in starts
+        }
+
+    @staticmethod
+    def _current_from_series(
+        readings: dict[str, Any],
+        now: datetime,
+        period: str = PERIOD_HOUR,
+    ) -> dict[str, Any] | None:
+        """
+        Derive a current reading from the latest point of a readings series.
+
+        Only a point whose bucket contains now is used. It is scaled to kWh
+        per minute, the shape of a PT1M response, over the minutes elapsed
+        since the bucket started, so the series must have been fetched at now.
+
+        Args:
+            readings: Readings response at the given resolution.
+            now: Time the series was fetched up to (UTC).
+            period: Resolution of the series.
+
+        Returns:
+            Readings response holding a single [timestamp, kWh per minute]
+            pair, or None when the latest point belongs to an earlier bucket
+            and therefore cannot stand in for current usage.
+
+        """
+        bucket_seconds = _PERIOD_SECONDS[period]
+        now_timestamp = now.timestamp()
+        for item in reversed(readings.get("data") or ()):
+            if len(item) < 2 or item[1] is None:
+                continue
+            timestamp, value = item[0], item[1]
+            elapsed_seconds = now_timestamp - timestamp
+            if not 0 <= elapsed_seconds < bucket_seconds:
+                return None
+            elapsed_minutes = max(elapsed_seconds / 60, 1)
+            return {"units": readings.get("units"), "data": [[timestamp, value / elapsed_minutes]]}
+        return None
 
     async def async_get_tariff(self, resource_id: str) -> dict[str, Any]:
         """
@@ -311,7 +673,7 @@ async def async_get_tariff(self, resource_id: str) -> dict[str, Any]:
             - currentRates: {rate, standingCharge} in pence
 
         """
-        return await self._api_request("get", f"resource/{resource_id}/tariff")
+        return await self._api_request("get", f"resource/{resource_id}/tariff", conditional=True)
 
     async def async_get_current(self, resource_id: str) -> dict[str, Any]:
         """
@@ -346,12 +708,198 @@ async def async_catchup(self, resource_id: str) -> dict[str, Any]:
         """
         return await self._api_request("get", f"resource/{resource_id}/catchup")
 
-    async def async_get_data(self) -> dict[str, Any]:
+    async def _gather_requests(
+        self,
+        requests: dict[str, Awaitable[Any]],
+        classifier: str,
+    ) -> dict[str, Any]:
+        """
+        Await named requests concurrently, dropping the ones that fail.
+
+        Args:
+            requests: Mapping of result key to the request awaitable.
+            classifier: Resource classifier, used for logging.
+
+        Returns:
+            Dictionary of result key to response for the successful requests.
+
+        """
+        results = await asyncio.gather(*requests.values(), return_exceptions=True)
+
+        fetched: dict[str, Any] = {}
+        for key, result in zip(requests, results, strict=True):
+            if isinstance(result, HildebrandGlowEnergyMonitorApiClientError):
+                LOGGER.debug("Failed to get %s data for %s: %s", key, classifier, result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            fetched[key] = result
+        return fetched
+
+    async def _fetch_resource(
+        self,
+        resource: ResourceSpec,
+        now: datetime,
+        windows: dict[str, datetime],
+        *,
+        include_current: bool = True,
+        include_tariff: bool = True,
+        current_pt1m: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Fetch readings and tariff for a single resource concurrently.
+
+        The window totals are all suffixes of the same series, so they are
+        derived from a single hourly query starting at the earliest window;
+        a week can start in the previous month, before the month window. PT1H
+        is used because Glowmarkt limits PT30M queries to 10 days. The
+        current reading is fetched at PT1M alongside it, or approximated from
+        the point of that series for the hour in progress when minute
+        resolution is turned off. Per-period queries are only used when the
+        hourly query returns no data. Failed requests are logged
+        and left out of the result so that one unavailable period does not
+        discard the others.
+
+        Args:
+            resource: The resource to fetch.
+            now: End of the reading windows (UTC).
+            windows: Mapping of window name (today, week, month) to its start (UTC).
+            include_current: Fetch the current reading for consumption resources.
+            include_tariff: Fetch the tariff for consumption resources.
+            current_pt1m: Fetch the current reading at PT1M resolution rather than
+                approximating it from the hourly series.
+
+        Returns:
+            Dictionary containing the resource classifier and whichever of
+            current, the requested windows and tariff could be fetched.
+
+        """
+        resource_id = resource.id
+        classifier = resource.classifier
+        recent_start = now - timedelta(minutes=5)
+        # Current reading and tariff only apply to consumption resources (not cost)
+        include_current = include_current and resource.is_consumption
+        include_tariff = include_tariff and resource.is_consumption
+        current_from_series = include_current and not current_pt1m
+
+        LOGGER.debug("Fetching data for resource: %s (%s)", resource_id, classifier)
+
+        requests: dict[str, Awaitable[Any]] = {
+            "series": self.async_get_readings(resource_id, min(windows.values()), now, period=PERIOD_HOUR),
+        }
+        if include_current and current_pt1m:
+            requests["current"] = self.async_get_readings(resource_id, recent_start, now, period=PERIOD_MINUTE)
+        if include_tariff:
+            requests["tariff"] = self.async_get_tariff(resource_id)
+
+        fetched = await self._gather_requests(requests, classifier)
+        fetched["classifier"] = classifier
+        series = fetched.pop("series", None)
+
+        if series and (aggregated := self._aggregate_readings(series, windows)):
+            fetched.update(aggregated)
+        else:
+            LOGGER.debug("No hourly readings for %s, falling back to per-period queries", classifier)
+            fetched.update(
+                await self._gather_requests(
+                    {
+                        name: self.async_get_readings(resource_id, start, now, period=_WINDOW_PERIODS[name])
+                        for name, start in windows.items()
+                    },
+                    classifier,
+                )
+            )
+
+        if current_from_series and series and (current := self._current_from_series(series, now)):
+            fetched["current"] = current
+
+        if "current" in fetched:
+            data_points = len(fetched["current"].get("data", []))
+            LOGGER.debug("Current readings for %s: %d data points", classifier, data_points)
+
+        return fetched
+
+    async def _process_ve(
+        self,
+        ve: dict[str, Any],
+        now: datetime,
+        windows: dict[str, datetime],
+        *,
+        include_current: bool = True,
+        include_tariff: bool = True,
+        current_pt1m: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Fetch resources, readings and tariffs for a single virtual entity.
+
+        Args:
+            ve: The virtual entity (smart meter).
+            now: End of the reading windows (UTC).
+            windows: Mapping of window name (today, week, month) to its start (UTC).
+            include_current: Fetch current readings.
+            include_tariff: Fetch tariffs.
+            current_pt1m: Fetch current readings at PT1M resolution.
+
+        Returns:
+            Meter data with the virtual entity, its resources, and readings,
+            current readings and tariffs keyed by classifier.
+
+        """
+        ve_id = ve["veId"]
+        LOGGER.debug("Processing virtual entity: %s", ve_id)
+        resources = await self.async_get_resources(ve_id)
+        LOGGER.debug("Found %d resources for %s", len(resources), ve_id)
+
+        meter_data: dict[str, Any] = {
+            "virtual_entity": ve,
+            "resources": resources,
+            "readings": {},
+            "current": {},
+            "tariffs": {},
+        }
+
+        specs = [ResourceSpec.from_resource(resource) for resource in resources if resource.get("resourceId")]
+        fetched_resources = await asyncio.gather(
+            *(
+                self._fetch_resource(
+                    spec,
+                    now,
+                    windows,
+                    include_current=include_current,
+                    include_tariff=include_tariff,
+                    current_pt1m=current_pt1m,
+                )
+                for spec in specs
+            )
+        )
+
+        for fetched in fetched_resources:
+            classifier = fetched["classifier"]
+            for period in windows:
+                if period in fetched:
+                    meter_data["readings"][_reading_key(classifier, period)] = fetched[period]
+            if "current" in fetched:
+                meter_data["current"][classifier] = fetched["current"]
+            if "tariff" in fetched:
+                meter_data["tariffs"][classifier] = fetched["tariff"]
+
+        return meter_data
+
+    async def async_get_data(self, *, scope: str | None = None, current_pt1m: bool = False) -> dict[str, Any]:
         """
         Get all energy data for the user.
 
         This fetches virtual entities, resources, readings, and tariffs
-        for all available smart meters.
+        for all available smart meters. Meters, and the requests for the
+        resources of each meter, are processed concurrently. A meter that
+        fails is left out unless every meter fails.
+
+        Args:
+            scope: SCOPE_DAILY for today's readings and current power,
+                SCOPE_HISTORICAL for week and month readings and tariffs,
+                or None for everything.
+            current_pt1m: Fetch current readings at PT1M resolution instead
+                of deriving them from the hourly series.
 
         Returns:
             Dictionary containing all energy data structured by meter.
@@ -362,110 +910,55 @@ async def async_get_data(self) -> dict[str, Any]:
             "meters": {},
         }
 
+        # One snapshot per poll so all reading windows share the same boundaries
+        now = datetime.now(tz=UTC)
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        windows: dict[str, datetime] = {}
+        if scope != SCOPE_HISTORICAL:
+            windows["today"] = today_start
+        if scope != SCOPE_DAILY:
+            windows["week"] = today_start - timedelta(days=today_start.weekday())
+            windows["month"] = today_start.replace(day=1)
+
+        # Authenticate up front rather than in each of the concurrent requests below
+        if self._is_token_expired(now):
+            await self._ensure_authenticated()
+
         # Get all virtual entities (smart meters)
         virtual_entities = await self.async_get_virtual_entities()
         result["virtual_entities"] = virtual_entities
 
-        # For each virtual entity, get resources and readings
-        for ve in virtual_entities:
-            ve_id = ve.get("veId")
-            if not ve_id:
+        # Process all virtual entities concurrently; a failing meter does not drop the others
+        ve_ids = [ve_id for ve in virtual_entities if (ve_id := ve.get("veId"))]
+        processed = await asyncio.gather(
+            *(
+                self._process_ve(
+                    ve,
+                    now,
+                    windows,
+                    include_current=scope != SCOPE_HISTORICAL,
+                    include_tariff=scope != SCOPE_DAILY,
+                    current_pt1m=current_pt1m,
+                )
+                for ve in virtual_entities
+                if ve.get("veId")
+            ),
+            return_exceptions=True,
+        )
+
+        errors: list[HildebrandGlowEnergyMonitorApiClientError] = []
+        for ve_id, outcome in zip(ve_ids, processed, strict=True):
+            if isinstance(outcome, HildebrandGlowEnergyMonitorApiClientAuthenticationError):
+                raise outcome
+            if isinstance(outcome, HildebrandGlowEnergyMonitorApiClientError):
+                LOGGER.warning("Failed to process virtual entity %s: %s", ve_id, outcome)
+                errors.append(outcome)
                 continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            result["meters"][ve_id] = outcome
 
-            LOGGER.debug("Processing virtual entity: %s", ve_id)
-            resources = await self.async_get_resources(ve_id)
-            LOGGER.debug("Found %d resources for %s", len(resources), ve_id)
-
-            meter_data: dict[str, Any] = {
-                "virtual_entity": ve,
-                "resources": resources,
-                "readings": {},
-                "current": {},
-                "tariffs": {},
-            }
-
-            # Calculate time ranges for readings
-            now = datetime.now(tz=UTC)
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            week_start = today_start - timedelta(days=today_start.weekday())
-            month_start = today_start.replace(day=1)
-
-            for resource in resources:
-                resource_id = resource.get("resourceId")
-                classifier = resource.get("classifier", "")
-
-                if not resource_id:
-                    continue
-
-                LOGGER.debug("Fetching data for resource: %s (%s)", resource_id, classifier)
-
-                # Get current/recent reading using PT1M resolution (for consumption resources only)
-                if "cost" not in classifier:
-                    try:
-                        # Use readings endpoint with 1-minute resolution for last 5 minutes
-                        recent_start = now - timedelta(minutes=5)
-                        LOGGER.debug(
-                            "Fetching PT1M readings for %s from %s to %s",
-                            classifier,
-                            recent_start.isoformat(),
-                            now.isoformat(),
-                        )
-                        current = await self.async_get_readings(
-                            resource_id,
-                            recent_start,
-                            now,
-                            period="PT1M",
-                        )
-                        meter_data["current"][classifier] = current
-                        data_points = len(current.get("data", []))
-                        LOGGER.debug("PT1M readings for %s: %d data points", classifier, data_points)
-                    except HildebrandGlowEnergyMonitorApiClientError as err:
-                        LOGGER.debug("Failed to get PT1M readings for %s: %s", classifier, err)
-
-                # Get today's readings
-                try:
-                    today_readings = await self.async_get_readings(
-                        resource_id,
-                        today_start,
-                        now,
-                        period="P1D",
-                    )
-                    meter_data["readings"][f"{classifier}_today"] = today_readings
-                except HildebrandGlowEnergyMonitorApiClientError:
-                    pass  # Skip if readings unavailable
-
-                # Get this week's readings
-                try:
-                    week_readings = await self.async_get_readings(
-                        resource_id,
-                        week_start,
-                        now,
-                        period="P1W",
-                    )
-                    meter_data["readings"][f"{classifier}_week"] = week_readings
-                except HildebrandGlowEnergyMonitorApiClientError:
-                    pass
-
-                # Get this month's readings
-                try:
-                    month_readings = await self.async_get_readings(
-                        resource_id,
-                        month_start,
-                        now,
-                        period="P1M",
-                    )
-                    meter_data["readings"][f"{classifier}_month"] = month_readings
-                except HildebrandGlowEnergyMonitorApiClientError:
-                    pass
-
-                # Get tariff if it's a consumption resource (not cost)
-                if "cost" not in classifier:
-                    try:
-                        tariff = await self.async_get_tariff(resource_id)
-                        meter_data["tariffs"][classifier] = tariff
-                    except HildebrandGlowEnergyMonitorApiClientError:
-                        pass
-
-            result["meters"][ve_id] = meter_data
+        if errors and not result["meters"]:
+            raise errors[0]
 
         return result
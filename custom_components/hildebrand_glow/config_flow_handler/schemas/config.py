@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -22,6 +23,10 @@
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.helpers import selector
 
+# Selectors are immutable value objects, so every schema shares one instance
+_TEXT_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT))
+_PASSWORD_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD))
+
 
 def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
     """
@@ -35,23 +40,7 @@ def get_user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
 
     """
     defaults = defaults or {}
-    return vol.Schema(
-        {
-            vol.Required(
-                CONF_USERNAME,
-                default=defaults.get(CONF_USERNAME, vol.UNDEFINED),
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                ),
-            ),
-            vol.Required(CONF_PASSWORD): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.PASSWORD,
-                ),
-            ),
-        },
-    )
+    return _credentials_schema(defaults.get(CONF_USERNAME, vol.UNDEFINED))
 
 
 def get_reconfigure_schema(username: str) -> vol.Schema:
@@ -65,25 +54,7 @@ def get_reconfigure_schema(username: str) -> vol.Schema:
         Voluptuous schema for reconfiguration.
 
     """
-    return vol.Schema(
-        {
-            vol.Required(
-                CONF_USERNAME,
-                default=username,
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                ),
-            ),
-            vol.Required(
-                CONF_PASSWORD,
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.PASSWORD,
-                ),
-            ),
-        },
-    )
+    return _credentials_schema(username)
 
 
 def get_reauth_schema(username: str) -> vol.Schema:
@@ -96,24 +67,32 @@ def get_reauth_schema(username: str) -> vol.Schema:
     Returns:
         Voluptuous schema for reauthentication.
 
+    """
+    return _credentials_schema(username)
+
+
+@lru_cache(maxsize=32)
+def _credentials_schema(username: Any) -> vol.Schema:
+    """
+    Build the username and password schema shared by all config steps.
+
+    Forms are re-rendered on every step, so schemas are cached per username
+    default instead of being rebuilt each time.
+
+    Args:
+        username: Username to pre-fill, or vol.UNDEFINED for an empty field.
+
+    Returns:
+        Voluptuous schema for credentials input.
+
     """
     return vol.Schema(
         {
             vol.Required(
                 CONF_USERNAME,
                 default=username,
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                ),
-            ),
-            vol.Required(
-                CONF_PASSWORD,
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.PASSWORD,
-                ),
-            ),
+            ): _TEXT_SELECTOR,
+            vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
         },
     )
 
@@ -13,13 +13,31 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
 
-from custom_components.hildebrand_glow.const import DEFAULT_ENABLE_DEBUGGING, DEFAULT_UPDATE_INTERVAL_MINUTES
+from custom_components.hildebrand_glow.const import (
+    DEFAULT_ENABLE_CURRENT_PT1M,
+    DEFAULT_ENABLE_DEBUGGING,
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
+)
 from homeassistant.helpers import selector
 
+# Selectors are immutable value objects, so every schema shares one instance
+_UPDATE_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=60,
+        step=1,
+        unit_of_measurement="min",
+        mode=selector.NumberSelectorMode.BOX,
+    ),
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_ICON_SELECTOR = selector.IconSelector()
+
 
 def get_options_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
     """
@@ -33,28 +51,55 @@ def get_options_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
 
     """
     defaults = defaults or {}
+    return _options_schema(
+        defaults.get("update_interval_minutes", DEFAULT_UPDATE_INTERVAL_MINUTES),
+        defaults.get("enable_debugging", DEFAULT_ENABLE_DEBUGGING),
+        defaults.get("enable_current_pt1m", DEFAULT_ENABLE_CURRENT_PT1M),
+        defaults.get("custom_icon"),
+    )
+
+
+@lru_cache(maxsize=32)
+def _options_schema(
+    update_interval_minutes: float,
+    enable_debugging: bool,
+    enable_current_pt1m: bool,
+    custom_icon: str | None,
+) -> vol.Schema:
+    """
+    Build the options schema for the given current values.
+
+    The options form is re-rendered on every step, so schemas are cached per
+    set of defaults instead of being rebuilt each time.
+
+    Args:
+        update_interval_minutes: Current update interval.
+        enable_debugging: Current debug logging setting.
+        enable_current_pt1m: Current minute-resolution power setting.
+        custom_icon: Current custom icon, if any.
+
+    Returns:
+        Voluptuous schema for options configuration.
+
+    """
     return vol.Schema(
         {
             vol.Optional(
                 "update_interval_minutes",
-                default=defaults.get("update_interval_minutes", DEFAULT_UPDATE_INTERVAL_MINUTES),
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=60,
-                    step=1,
-                    unit_of_measurement="min",
-                    mode=selector.NumberSelectorMode.BOX,
-                ),
-            ),
+                default=update_interval_minutes,
+            ): _UPDATE_INTERVAL_SELECTOR,
             vol.Optional(
                 "enable_debugging",
-                default=defaults.get("enable_debugging", DEFAULT_ENABLE_DEBUGGING),
-            ): selector.BooleanSelector(),
+                default=enable_debugging,
+            ): _BOOLEAN_SELECTOR,
+            vol.Optional(
+                "enable_current_pt1m",
+                default=enable_current_pt1m,
+            ): _BOOLEAN_SELECTOR,
             vol.Optional(
                 "custom_icon",
-                default=defaults.get("custom_icon"),
-            ): selector.IconSelector(),
+                default=custom_icon,
+            ): _ICON_SELECTOR,
         },
     )
 
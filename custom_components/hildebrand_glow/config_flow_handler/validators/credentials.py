@@ -14,7 +14,7 @@
 from typing import TYPE_CHECKING
 
 from custom_components.hildebrand_glow.api import HildebrandGlowEnergyMonitorApiClient
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -41,7 +41,7 @@ async def validate_credentials(hass: HomeAssistant, username: str, password: str
     client = HildebrandGlowEnergyMonitorApiClient(
         username=username,
         password=password,
-        session=async_create_clientsession(hass),
+        session=async_get_clientsession(hass),
     )
     # Authenticate to verify credentials are valid
     await client.async_authenticate()
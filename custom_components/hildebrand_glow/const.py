@@ -15,6 +15,9 @@
 API_URL = "https://api.glowmarkt.com/api/v0-1"
 APPLICATION_ID = "b0f1b774-a586-4f72-9edd-27ead8aa7a8d"
 
+# Storage for the API token so it survives restarts
+TOKEN_STORAGE_VERSION = 1
+
 # Resource classifiers for energy data
 CLASSIFIER_ELECTRICITY_CONSUMPTION = "electricity.consumption"
 CLASSIFIER_ELECTRICITY_COST = "electricity.consumption.cost"
@@ -22,6 +25,8 @@
 CLASSIFIER_GAS_COST = "gas.consumption.cost"
 
 # API period parameters for readings queries
+PERIOD_MINUTE = "PT1M"
+PERIOD_HOUR = "PT1H"
 PERIOD_DAY = "P1D"
 PERIOD_WEEK = "P1W"
 PERIOD_MONTH = "P1M"
@@ -30,6 +35,11 @@
 UPDATE_INTERVAL_DAILY = 5  # Poll daily data every 5 minutes
 UPDATE_INTERVAL_HISTORICAL = 60  # Poll weekly/monthly data every hour
 
+# Data scopes, each polled by its own coordinator
+SCOPE_DAILY = "daily"  # Today's readings and current power
+SCOPE_HISTORICAL = "historical"  # Week and month readings and tariffs
+
 # Default configuration values
 DEFAULT_UPDATE_INTERVAL_MINUTES = 5
 DEFAULT_ENABLE_DEBUGGING = False
+DEFAULT_ENABLE_CURRENT_PT1M = True
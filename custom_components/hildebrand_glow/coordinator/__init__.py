@@ -5,7 +5,8 @@
 data updates and distributing them to all entities in the integration.
 
 Package structure:
-- base.py: Main coordinator class (HildebrandGlowEnergyMonitorDataUpdateCoordinator)
+- base.py: Coordinator base class (HildebrandGlowEnergyMonitorDataUpdateCoordinator)
+  and the daily and historical coordinators built on it
 - data_processing.py: Data validation, transformation, and caching utilities
 - error_handling.py: Error recovery strategies and retry logic
 - listeners.py: Event listeners and entity callbacks
@@ -16,6 +17,14 @@
 
 from __future__ import annotations
 
-from .base import HildebrandGlowEnergyMonitorDataUpdateCoordinator
+from .base import (
+    HildebrandGlowEnergyMonitorDailyCoordinator,
+    HildebrandGlowEnergyMonitorDataUpdateCoordinator,
+    HildebrandGlowEnergyMonitorHistoricalCoordinator,
+)
 
-__all__ = ["HildebrandGlowEnergyMonitorDataUpdateCoordinator"]
+__all__ = [
+    "HildebrandGlowEnergyMonitorDailyCoordinator",
+    "HildebrandGlowEnergyMonitorDataUpdateCoordinator",
+    "HildebrandGlowEnergyMonitorHistoricalCoordinator",
+]
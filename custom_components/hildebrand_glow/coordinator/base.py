@@ -11,6 +11,8 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+import sys
 from typing import TYPE_CHECKING, Any
 
 from custom_components.hildebrand_glow.api import (
@@ -22,14 +24,115 @@
     CLASSIFIER_ELECTRICITY_COST,
     CLASSIFIER_GAS_CONSUMPTION,
     CLASSIFIER_GAS_COST,
+    DEFAULT_ENABLE_CURRENT_PT1M,
+    DOMAIN,
     LOGGER,
+    SCOPE_DAILY,
+    SCOPE_HISTORICAL,
 )
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import TimestampDataUpdateCoordinator, UpdateFailed
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from custom_components.hildebrand_glow.data import HildebrandGlowEnergyMonitorConfigEntry
 
+# (energy type, measure, readings classifier) for each usage and cost total
+_READING_SOURCES: tuple[tuple[str, str, str], ...] = (
+    ("electricity", "usage", CLASSIFIER_ELECTRICITY_CONSUMPTION),
+    ("electricity", "cost", CLASSIFIER_ELECTRICITY_COST),
+    ("gas", "usage", CLASSIFIER_GAS_CONSUMPTION),
+    ("gas", "cost", CLASSIFIER_GAS_COST),
+)
+
+
+def _reading_keys(periods: tuple[str, ...]) -> tuple[tuple[str, str, bool], ...]:
+    """
+    Return (transformed key, readings key, whether the value is a cost in pence) for the periods.
+
+    Keys are interned so lookups match the API client's interned readings keys by identity.
+    """
+    return tuple(
+        (sys.intern(f"{energy_type}_{measure}_{period}"), sys.intern(f"{classifier}_{period}"), measure == "cost")
+        for energy_type, measure, classifier in _READING_SOURCES
+        for period in periods
+    )
+
+
+_DAILY_READING_KEYS = _reading_keys(("today",))
+_HISTORICAL_READING_KEYS = _reading_keys(("week", "month"))
+_READING_KEYS = _reading_keys(("today", "week", "month"))
+
+# (tariff classifier, transformed rate key, transformed standing charge key)
+_TARIFF_KEYS: tuple[tuple[str, str, str], ...] = (
+    (CLASSIFIER_ELECTRICITY_CONSUMPTION, "electricity_rate", "electricity_standing_charge"),
+    (CLASSIFIER_GAS_CONSUMPTION, "gas_rate", "gas_standing_charge"),
+)
+
+
+def _sum_and_convert(
+    reading_data: dict[str, Any] | None,
+    *,
+    to_gbp: bool,
+) -> float | None:
+    """
+    Sum a readings response, optionally converting the total from pence to GBP.
+
+    Args:
+        reading_data: The readings response from the API.
+        to_gbp: Whether the readings are costs in pence to convert to GBP.
+
+    Returns:
+        The sum of all reading values (kWh to 3 decimal places, or GBP to 2),
+        or None if unavailable.
+    """
+    if not reading_data:
+        return None
+
+    data = reading_data.get("data")
+    if not data:
+        return None
+
+    # Sum all values in the data array (each item is [timestamp, value])
+    total = 0.0
+    for item in data:
+        if len(item) >= 2:
+            value = item[1]
+            if value is not None:
+                total += value
+    return round(total / 100.0, 2) if to_gbp else round(total, 3)
+
+
+def _build_totals_transform(
+    reading_keys: tuple[tuple[str, str, bool], ...],
+) -> Callable[[dict[str, Any], dict[str, Any]], None]:
+    """
+    Build a transform specialized on a fixed set of usage and cost totals.
+
+    The key table is split by conversion once, so each refresh runs two flat
+    loops over (transformed key, readings key) pairs with no per-field flag.
+
+    Args:
+        reading_keys: (transformed key, readings key, is cost) for each total.
+
+    Returns:
+        Function that writes the totals from a meter's readings into a dict.
+    """
+    usage_keys = tuple((out_key, reading_key) for out_key, reading_key, is_cost in reading_keys if not is_cost)
+    cost_keys = tuple((out_key, reading_key) for out_key, reading_key, is_cost in reading_keys if is_cost)
+    sum_and_convert = _sum_and_convert
+
+    def transform_totals(readings: dict[str, Any], out: dict[str, Any]) -> None:
+        get = readings.get
+        for out_key, reading_key in usage_keys:
+            out[out_key] = sum_and_convert(get(reading_key), to_gbp=False)
+        for out_key, reading_key in cost_keys:
+            out[out_key] = sum_and_convert(get(reading_key), to_gbp=True)
+
+    return transform_totals
+
 
 class HildebrandGlowEnergyMonitorDataUpdateCoordinator(TimestampDataUpdateCoordinator):
     """
@@ -43,12 +146,36 @@ class HildebrandGlowEnergyMonitorDataUpdateCoordinator(TimestampDataUpdateCoordi
     - Pence-to-GBP conversion for cost data
     - Data distribution to all entities
 
+    Subclasses narrow the coordinator to one data scope so fast and slow
+    changing data can be polled at different intervals.
+
     Attributes:
         config_entry: The config entry for this integration instance.
+        scope: The data scope requested from the API client, or None for all data.
     """
 
     config_entry: HildebrandGlowEnergyMonitorConfigEntry
 
+    scope: str | None = None
+    _reading_keys: tuple[tuple[str, str, bool], ...] = _READING_KEYS
+    _tariff_keys: tuple[tuple[str, str, str], ...] = _TARIFF_KEYS
+    _include_current = True
+
+    # Upper bound on the delay between refreshes while the API keeps failing
+    MAX_FAILURE_BACKOFF = timedelta(hours=1)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator and the per-instance state used by refreshes."""
+        super().__init__(*args, **kwargs)
+        # Specialize the totals transform on this coordinator's fixed key set once
+        self._transform_totals = _build_totals_transform(self._reading_keys)
+        # Failed refreshes in a row, used to back off while the API is struggling
+        self._consecutive_failures = 0
+        # Device info shared by all entities of a meter, by meter ID
+        self._device_info_cache: dict[str, DeviceInfo] = {}
+        # Raw meter payload and transformed data from the previous refresh, by meter ID
+        self._transform_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+
     async def _async_setup(self) -> None:
         """
         Set up the coordinator.
@@ -58,6 +185,35 @@ async def _async_setup(self) -> None:
         """
         LOGGER.debug("Coordinator setup complete for %s", self.config_entry.entry_id)
 
+    def get_device_info(self, meter_id: str) -> DeviceInfo:
+        """
+        Return the device info for a meter, shared by all of its entities.
+
+        The cached DeviceInfo is rebuilt only when the meter's name or model changes.
+
+        Args:
+            meter_id: The virtual entity (meter) ID.
+
+        Returns:
+            Device info for the meter.
+        """
+        meter_data = self.data.get("meters", {}).get(meter_id, {})
+        name = meter_data.get("name", "Smart Meter")
+        model = meter_data.get("model", "Smart Meter")
+
+        device_info = self._device_info_cache.get(meter_id)
+        if device_info is None or device_info.get("name") != name or device_info.get("model") != model:
+            # Identifiers never change for a meter, so a rebuild keeps the same set
+            identifiers = device_info["identifiers"] if device_info else {(DOMAIN, sys.intern(meter_id))}
+            device_info = DeviceInfo(
+                identifiers=identifiers,
+                name=name,
+                manufacturer="Hildebrand Technology",
+                model=model,
+            )
+            self._device_info_cache[meter_id] = device_info
+        return device_info
+
     async def _async_update_data(self) -> dict[str, Any]:
         """
         Fetch data from API endpoint and transform for entities.
@@ -72,11 +228,15 @@ async def _async_update_data(self) -> dict[str, Any]:
 
         Raises:
             ConfigEntryAuthFailed: If authentication fails, triggers reauthentication.
-            UpdateFailed: If data fetching fails for other reasons.
+            UpdateFailed: If data fetching fails for other reasons, with a retry
+                delay that backs off while failures continue.
         """
         try:
-            LOGGER.debug("Fetching energy data from Glowmarkt API")
-            raw_data = await self.config_entry.runtime_data.client.async_get_data()
+            LOGGER.debug("Fetching %s energy data from Glowmarkt API", self.scope or "all")
+            raw_data = await self.config_entry.runtime_data.client.async_get_data(
+                scope=self.scope,
+                current_pt1m=self.config_entry.options.get("enable_current_pt1m", DEFAULT_ENABLE_CURRENT_PT1M),
+            )
             LOGGER.debug("Raw data received, transforming for entities")
             transformed = self._transform_data(raw_data)
             LOGGER.debug("Data transformation complete, %d meters found", len(transformed.get("meters", {})))
@@ -88,18 +248,35 @@ async def _async_update_data(self) -> dict[str, Any]:
             ) from exception
         except HildebrandGlowEnergyMonitorApiClientError as exception:
             LOGGER.exception("Error communicating with API")
+            self._consecutive_failures += 1
             raise UpdateFailed(
                 translation_domain="hildebrand_glow",
                 translation_key="update_failed",
+                retry_after=self._failure_backoff().total_seconds(),
             ) from exception
         else:
+            self._consecutive_failures = 0
             return transformed
 
+    def _failure_backoff(self) -> timedelta:
+        """
+        Return the delay before the next refresh after consecutive failures.
+
+        Doubles the update interval for each failure after the first, capped at
+        MAX_FAILURE_BACKOFF, so an outage or rate limit is not hammered on every
+        interval. The coordinator schedules the retry; nothing sleeps here.
+        """
+        interval = self.update_interval or self.MAX_FAILURE_BACKOFF
+        exponent = min(self._consecutive_failures - 1, 6)
+        return min(interval * 2**exponent, self.MAX_FAILURE_BACKOFF)
+
     def _transform_data(self, raw_data: dict[str, Any]) -> dict[str, Any]:
         """
         Transform raw API data into entity-friendly format.
 
         Converts pence to GBP and structures data for easy entity access.
+        Meters whose readings, tariffs and metadata are unchanged since the
+        previous refresh reuse the previous result.
 
         Args:
             raw_data: Raw data from the API client.
@@ -112,82 +289,38 @@ def _transform_data(self, raw_data: dict[str, Any]) -> dict[str, Any]:
         }
 
         meters = raw_data.get("meters", {})
+        previous_cache = self._transform_cache
+        self._transform_cache = {}
 
-        for meter_id, meter_data in meters.items():
+        for raw_meter_id, meter_data in meters.items():
+            # Interned so every refresh, entity and device lookup shares one ID string
+            meter_id = sys.intern(raw_meter_id)
             ve = meter_data.get("virtual_entity", {})
             readings = meter_data.get("readings", {})
             current = meter_data.get("current", {})
             tariffs = meter_data.get("tariffs", {})
             resources = meter_data.get("resources", [])
 
-            # Determine what types of meters are available
-            has_electricity = any(r.get("classifier", "").startswith("electricity") for r in resources)
-            has_gas = any(r.get("classifier", "").startswith("gas") for r in resources)
-
-            # Build model string based on available meters
-            if has_electricity and has_gas:
-                model = "Electricity & Gas Smart Meter"
-            elif has_electricity:
-                model = "Electricity Smart Meter"
-            elif has_gas:
-                model = "Gas Smart Meter"
+            # Totals and tariffs only change when new half-hourly data lands, so most
+            # polls can reuse the previous result; current power is always recomputed
+            payload = (ve, resources, readings, tariffs)
+            cached = previous_cache.get(meter_id)
+            if cached is not None and cached[0] == payload:
+                meter_static = cached[1]
             else:
-                model = "Smart Meter"
-
-            meter_transformed: dict[str, Any] = {
-                "meter_id": meter_id,
-                "name": ve.get("name", "Smart Meter"),
-                "postal_code": ve.get("postalCode"),
-                "model": model,
-                "has_electricity": has_electricity,
-                "has_gas": has_gas,
-                # Real-time power data (kW)
-                "electricity_power_current": self._extract_current_power(
-                    current.get(CLASSIFIER_ELECTRICITY_CONSUMPTION)
-                ),
-                "gas_power_current": self._extract_current_power(current.get(CLASSIFIER_GAS_CONSUMPTION)),
-                # Electricity data
-                "electricity_usage_today": self._extract_reading_value(
-                    readings.get(f"{CLASSIFIER_ELECTRICITY_CONSUMPTION}_today")
-                ),
-                "electricity_usage_week": self._extract_reading_value(
-                    readings.get(f"{CLASSIFIER_ELECTRICITY_CONSUMPTION}_week")
-                ),
-                "electricity_usage_month": self._extract_reading_value(
-                    readings.get(f"{CLASSIFIER_ELECTRICITY_CONSUMPTION}_month")
-                ),
-                "electricity_cost_today": self._pence_to_gbp(
-                    self._extract_reading_value(readings.get(f"{CLASSIFIER_ELECTRICITY_COST}_today"))
-                ),
-                "electricity_cost_week": self._pence_to_gbp(
-                    self._extract_reading_value(readings.get(f"{CLASSIFIER_ELECTRICITY_COST}_week"))
-                ),
-                "electricity_cost_month": self._pence_to_gbp(
-                    self._extract_reading_value(readings.get(f"{CLASSIFIER_ELECTRICITY_COST}_month"))
-                ),
-                # Gas data
-                "gas_usage_today": self._extract_reading_value(readings.get(f"{CLASSIFIER_GAS_CONSUMPTION}_today")),
-                "gas_usage_week": self._extract_reading_value(readings.get(f"{CLASSIFIER_GAS_CONSUMPTION}_week")),
-                "gas_usage_month": self._extract_reading_value(readings.get(f"{CLASSIFIER_GAS_CONSUMPTION}_month")),
-                "gas_cost_today": self._pence_to_gbp(
-                    self._extract_reading_value(readings.get(f"{CLASSIFIER_GAS_COST}_today"))
-                ),
-                "gas_cost_week": self._pence_to_gbp(
-                    self._extract_reading_value(readings.get(f"{CLASSIFIER_GAS_COST}_week"))
-                ),
-                "gas_cost_month": self._pence_to_gbp(
-                    self._extract_reading_value(readings.get(f"{CLASSIFIER_GAS_COST}_month"))
-                ),
-                # Tariff data (convert pence to GBP for standing charge)
-                "electricity_rate": self._extract_tariff_rate(tariffs.get(CLASSIFIER_ELECTRICITY_CONSUMPTION)),
-                "electricity_standing_charge": self._pence_to_gbp(
-                    self._extract_standing_charge(tariffs.get(CLASSIFIER_ELECTRICITY_CONSUMPTION))
-                ),
-                "gas_rate": self._extract_tariff_rate(tariffs.get(CLASSIFIER_GAS_CONSUMPTION)),
-                "gas_standing_charge": self._pence_to_gbp(
-                    self._extract_standing_charge(tariffs.get(CLASSIFIER_GAS_CONSUMPTION))
-                ),
-            }
+                meter_static = self._transform_meter(meter_id, ve, resources, readings, tariffs)
+            self._transform_cache[meter_id] = (payload, meter_static)
+
+            meter_transformed = meter_static
+            if self._include_current:
+                meter_transformed = {
+                    **meter_static,
+                    # Real-time power data (kW)
+                    "electricity_power_current": self._extract_current_power(
+                        current.get(CLASSIFIER_ELECTRICITY_CONSUMPTION)
+                    ),
+                    "gas_power_current": self._extract_current_power(current.get(CLASSIFIER_GAS_CONSUMPTION)),
+                }
 
             LOGGER.debug(
                 "Meter %s: electricity_power=%s kW, gas_power=%s kW, electricity_today=%s kWh, gas_today=%s kWh",
@@ -202,26 +335,67 @@ def _transform_data(self, raw_data: dict[str, Any]) -> dict[str, Any]:
 
         return transformed
 
-    def _extract_reading_value(self, reading_data: dict[str, Any] | None) -> float | None:
+    def _transform_meter(
+        self,
+        meter_id: str,
+        ve: dict[str, Any],
+        resources: list[dict[str, Any]],
+        readings: dict[str, Any],
+        tariffs: dict[str, Any],
+    ) -> dict[str, Any]:
         """
-        Extract the total value from a readings response.
+        Transform the slowly changing data of a single meter.
 
         Args:
-            reading_data: The readings response from the API.
+            meter_id: The virtual entity (meter) ID.
+            ve: The virtual entity from the API.
+            resources: The meter's resources.
+            readings: Readings responses keyed by classifier and period.
+            tariffs: Tariff responses keyed by classifier.
 
         Returns:
-            The sum of all reading values, or None if unavailable.
+            Meter metadata, usage and cost totals, and tariff values.
         """
-        if not reading_data:
-            return None
+        # Determine what types of meters are available in a single pass
+        has_electricity = has_gas = False
+        for resource in resources:
+            classifier = resource.get("classifier") or ""
+            if classifier.startswith("electricity"):
+                has_electricity = True
+            elif classifier.startswith("gas"):
+                has_gas = True
+            if has_electricity and has_gas:
+                break
+
+        # Build model string based on available meters
+        if has_electricity and has_gas:
+            model = "Electricity & Gas Smart Meter"
+        elif has_electricity:
+            model = "Electricity Smart Meter"
+        elif has_gas:
+            model = "Gas Smart Meter"
+        else:
+            model = "Smart Meter"
+
+        meter_transformed: dict[str, Any] = {
+            "meter_id": meter_id,
+            "name": ve.get("name", "Smart Meter"),
+            "postal_code": ve.get("postalCode"),
+            "model": model,
+            "has_electricity": has_electricity,
+            "has_gas": has_gas,
+        }
 
-        data = reading_data.get("data", [])
-        if not data:
-            return None
+        # Usage and cost totals (costs converted from pence to GBP)
+        self._transform_totals(readings, meter_transformed)
+
+        # Tariff data (convert pence to GBP for standing charge)
+        for classifier, rate_key, standing_charge_key in self._tariff_keys:
+            rate, standing_charge = self._extract_tariff(tariffs.get(classifier))
+            meter_transformed[rate_key] = rate
+            meter_transformed[standing_charge_key] = self._pence_to_gbp(standing_charge)
 
-        # Sum all values in the data array (each item is [timestamp, value])
-        total = sum(item[1] for item in data if len(item) >= 2 and item[1] is not None)
-        return round(total, 3)
+        return meter_transformed
 
     def _pence_to_gbp(self, pence: float | None) -> float | None:
         """
@@ -237,48 +411,35 @@ def _pence_to_gbp(self, pence: float | None) -> float | None:
             return None
         return round(pence / 100.0, 2)
 
-    def _extract_tariff_rate(self, tariff_data: dict[str, Any] | None) -> float | None:
+    def _extract_tariff(
+        self,
+        tariff_data: dict[str, Any] | None,
+    ) -> tuple[float | None, float | None]:
         """
-        Extract the tariff rate from tariff response.
+        Extract the rate and standing charge from tariff response.
 
         Args:
             tariff_data: The tariff response from the API.
 
         Returns:
-            The rate in pence per kWh, or None if unavailable.
+            The rate in pence per kWh and the standing charge in pence per day,
+            each None if unavailable.
         """
         if not tariff_data:
-            return None
+            return None, None
 
-        data = tariff_data.get("data", [])
+        data = tariff_data.get("data")
         if not data:
-            return None
+            return None, None
 
         # Get the first (most recent) tariff
-        current_rates = data[0].get("currentRates", {}) if data else {}
+        current_rates = data[0].get("currentRates") or {}
         rate = current_rates.get("rate")
-        return round(rate, 4) if rate is not None else None
-
-    def _extract_standing_charge(self, tariff_data: dict[str, Any] | None) -> float | None:
-        """
-        Extract the standing charge from tariff response.
-
-        Args:
-            tariff_data: The tariff response from the API.
-
-        Returns:
-            The standing charge in pence per day, or None if unavailable.
-        """
-        if not tariff_data:
-            return None
-
-        data = tariff_data.get("data", [])
-        if not data:
-            return None
-
-        current_rates = data[0].get("currentRates", {}) if data else {}
         charge = current_rates.get("standingCharge")
-        return round(charge, 2) if charge is not None else None
+        return (
+            round(rate, 4) if rate is not None else None,
+            round(charge, 2) if charge is not None else None,
+        )
 
     def _extract_current_power(self, current_data: dict[str, Any] | None) -> float | None:
         """
@@ -322,3 +483,19 @@ def _extract_current_power(self, current_data: dict[str, Any] | None) -> float |
 
         LOGGER.debug("No valid readings found in PT1M data")
         return None
+
+
+class HildebrandGlowEnergyMonitorDailyCoordinator(HildebrandGlowEnergyMonitorDataUpdateCoordinator):
+    """Coordinator for today's readings and current power, polled at the configured interval."""
+
+    scope = SCOPE_DAILY
+    _reading_keys = _DAILY_READING_KEYS
+    _tariff_keys = ()
+
+
+class HildebrandGlowEnergyMonitorHistoricalCoordinator(HildebrandGlowEnergyMonitorDataUpdateCoordinator):
+    """Coordinator for week and month readings and tariffs, which change at most hourly."""
+
+    scope = SCOPE_HISTORICAL
+    _reading_keys = _HISTORICAL_READING_KEYS
+    _include_current = False
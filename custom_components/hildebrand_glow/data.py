@@ -10,16 +10,20 @@
     from homeassistant.loader import Integration
 
     from .api import HildebrandGlowEnergyMonitorApiClient
-    from .coordinator import HildebrandGlowEnergyMonitorDataUpdateCoordinator
+    from .coordinator import (
+        HildebrandGlowEnergyMonitorDailyCoordinator,
+        HildebrandGlowEnergyMonitorHistoricalCoordinator,
+    )
 
 
 type HildebrandGlowEnergyMonitorConfigEntry = ConfigEntry[HildebrandGlowEnergyMonitorData]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HildebrandGlowEnergyMonitorData:
     """Data for hildebrand_glow."""
 
     client: HildebrandGlowEnergyMonitorApiClient
-    coordinator: HildebrandGlowEnergyMonitorDataUpdateCoordinator
+    coordinator: HildebrandGlowEnergyMonitorDailyCoordinator
+    historical_coordinator: HildebrandGlowEnergyMonitorHistoricalCoordinator
     integration: Integration
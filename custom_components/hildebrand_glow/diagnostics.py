@@ -34,6 +34,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data.coordinator
+    historical_coordinator = entry.runtime_data.historical_coordinator
     client = entry.runtime_data.client
     integration = entry.runtime_data.integration
 
@@ -73,6 +74,13 @@ async def async_get_config_entry_diagnostics(
         "update_interval": str(coordinator.update_interval),
         "data_keys": list(coordinator.data.keys()) if isinstance(coordinator.data, dict) else None,
     }
+    historical_coordinator_info = {
+        "last_update_success": historical_coordinator.last_update_success,
+        "update_interval": str(historical_coordinator.update_interval),
+        "last_exception": (
+            str(historical_coordinator.last_exception) if historical_coordinator.last_exception else None
+        ),
+    }
 
     # API client information (no sensitive data)
     api_info = {
@@ -124,6 +132,7 @@ async def async_get_config_entry_diagnostics(
         "entry": entry_info,
         "integration": integration_info,
         "coordinator": coordinator_info,
+        "historical_coordinator": historical_coordinator_info,
         "api": api_info,
         "devices": device_info,
         "data_sample": data_sample,
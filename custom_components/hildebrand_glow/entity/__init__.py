@@ -1,5 +1,6 @@
 """Entity package for hildebrand_glow."""
 
 from .base import HildebrandGlowEnergyMonitorEntity
+from .meter import HildebrandGlowEnergyMonitorMeterEntity
 
-__all__ = ["HildebrandGlowEnergyMonitorEntity"]
+__all__ = ["HildebrandGlowEnergyMonitorEntity", "HildebrandGlowEnergyMonitorMeterEntity"]
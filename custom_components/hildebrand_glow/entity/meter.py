@@ -0,0 +1,83 @@
+"""
+Meter entity class for hildebrand_glow.
+
+This module provides the base class for entities that report data for a single
+smart meter (virtual entity). It resolves the meter's data from the coordinator
+once per update and stores the derived state in `_attr_*` attributes, so state
+writes do not go through Python property overrides.
+
+For more information on entities:
+https://developers.home-assistant.io/docs/core/entity
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .base import HildebrandGlowEnergyMonitorEntity
+
+if TYPE_CHECKING:
+    from custom_components.hildebrand_glow.coordinator import HildebrandGlowEnergyMonitorDataUpdateCoordinator
+    from homeassistant.helpers.device_registry import DeviceInfo
+    from homeassistant.helpers.entity import EntityDescription
+
+# Shared fallback for meters missing from the coordinator data, never mutated
+_EMPTY_METER_DATA: dict[str, Any] = {}
+
+
+class HildebrandGlowEnergyMonitorMeterEntity(HildebrandGlowEnergyMonitorEntity):
+    """
+    Base class for entities belonging to a single smart meter.
+
+    Attributes:
+        _data_key: The meter data key holding the entity's value.
+        _has_key: The meter data flag that gates availability.
+        _meter_id: The virtual entity (meter) ID.
+        _meter_data: The meter's data from the latest coordinator update.
+
+    """
+
+    _data_key: str
+    _has_key: str
+
+    def __init__(
+        self,
+        coordinator: HildebrandGlowEnergyMonitorDataUpdateCoordinator,
+        entity_description: EntityDescription,
+        meter_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """
+        Initialize the meter entity.
+
+        Args:
+            coordinator: The data update coordinator.
+            entity_description: The entity description.
+            meter_id: The virtual entity (meter) ID.
+            device_info: The device info for this meter.
+
+        """
+        super().__init__(coordinator, entity_description)
+        # Interned because both are used as dict keys on every update and registry lookup
+        self._meter_id = sys.intern(meter_id)
+        # Override unique_id to include meter_id for multi-meter support
+        self._attr_unique_id = sys.intern(f"{coordinator.config_entry.entry_id}_{meter_id}_{entity_description.key}")
+        self._attr_device_info = device_info
+        self._refresh_meter_state()
+
+    def _refresh_meter_state(self) -> None:
+        """Resolve this meter's data and derive the entity state from it."""
+        meter_data = self.coordinator.data.get("meters", _EMPTY_METER_DATA).get(self._meter_id) or _EMPTY_METER_DATA
+        self._meter_data = meter_data
+        # CoordinatorEntity.available already ANDs in last_update_success
+        self._attr_available = meter_data.get(self._has_key, False)
+        self._attr_native_value = meter_data.get(self._data_key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached meter state before the state is written."""
+        self._refresh_meter_state()
+        super()._handle_coordinator_update()
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from custom_components.hildebrand_glow.const import DOMAIN, PARALLEL_UPDATES as PARALLEL_UPDATES
-from homeassistant.helpers.device_registry import DeviceInfo
+from custom_components.hildebrand_glow.const import PARALLEL_UPDATES as PARALLEL_UPDATES
+from homeassistant.core import callback
 
 from .diagnostic import ENTITY_DESCRIPTIONS as DIAGNOSTIC_DESCRIPTIONS, HildebrandGlowDiagnosticSensor
-from .electricity import ENTITY_DESCRIPTIONS as ELECTRICITY_DESCRIPTIONS, HildebrandGlowElectricitySensor
-from .gas import ENTITY_DESCRIPTIONS as GAS_DESCRIPTIONS, HildebrandGlowGasSensor
-from .tariff import ENTITY_DESCRIPTIONS as TARIFF_DESCRIPTIONS, HildebrandGlowTariffSensor
+from .electricity import ENTITY_DESCRIPTIONS as ELECTRICITY_DESCRIPTIONS
+from .gas import ENTITY_DESCRIPTIONS as GAS_DESCRIPTIONS
+from .meter import HildebrandGlowSensor
+from .tariff import ENTITY_DESCRIPTIONS as TARIFF_DESCRIPTIONS
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from custom_components.hildebrand_glow.coordinator import HildebrandGlowEnergyMonitorDataUpdateCoordinator
     from custom_components.hildebrand_glow.data import HildebrandGlowEnergyMonitorConfigEntry
+    from homeassistant.components.sensor import SensorEntity
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+# Every meter sensor description; each is created for meters whose has_key flag is set
+ALL_DESCRIPTIONS = (*ELECTRICITY_DESCRIPTIONS, *GAS_DESCRIPTIONS, *TARIFF_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,77 +33,56 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     coordinator = entry.runtime_data.coordinator
-    entities: list = []
-
-    # Get meters from coordinator data
-    meters = coordinator.data.get("meters", {})
-
-    for meter_id, meter_data in meters.items():
-        # Create device info for this meter
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, meter_id)},
-            name=meter_data.get("name", "Smart Meter"),
-            manufacturer="Hildebrand Technology",
-            model=meter_data.get("model", "Smart Meter"),
-        )
-
-        # Add electricity sensors if electricity is available
-        if meter_data.get("has_electricity", False):
-            entities.extend(
-                HildebrandGlowElectricitySensor(
-                    coordinator=coordinator,
-                    entity_description=description,
-                    meter_id=meter_id,
-                    device_info=device_info,
-                )
-                for description in ELECTRICITY_DESCRIPTIONS
-            )
+    historical_coordinator = entry.runtime_data.historical_coordinator
 
-            # Add electricity tariff sensors
-            entities.extend(
-                HildebrandGlowTariffSensor(
-                    coordinator=coordinator,
-                    entity_description=description,
-                    meter_id=meter_id,
-                    device_info=device_info,
-                )
-                for description in TARIFF_DESCRIPTIONS
-                if description.energy_type == "electricity"
-            )
+    # (meter_id, description key) pairs that already have an entity
+    added: set[tuple[str, str]] = set()
 
-        # Add gas sensors if gas is available
-        if meter_data.get("has_gas", False):
-            entities.extend(
-                HildebrandGlowGasSensor(
-                    coordinator=coordinator,
-                    entity_description=description,
-                    meter_id=meter_id,
-                    device_info=device_info,
-                )
-                for description in GAS_DESCRIPTIONS
-            )
+    @callback
+    def _async_add_new_entities() -> None:
+        """Add sensors for meters, or energy types of a meter, not seen before."""
+        meters = coordinator.data.get("meters", {})
+        if entities := [
+            entity
+            for meter_id, meter_data in meters.items()
+            for entity in _meter_entities(coordinator, historical_coordinator, meter_id, meter_data, added)
+        ]:
+            async_add_entities(entities)
+
+    _async_add_new_entities()
+    # A meter that gains gas or electricity later gets its sensors on the next update
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
 
-            # Add gas tariff sensors
-            entities.extend(
-                HildebrandGlowTariffSensor(
-                    coordinator=coordinator,
-                    entity_description=description,
-                    meter_id=meter_id,
-                    device_info=device_info,
-                )
-                for description in TARIFF_DESCRIPTIONS
-                if description.energy_type == "gas"
+
+def _meter_entities(
+    coordinator: HildebrandGlowEnergyMonitorDataUpdateCoordinator,
+    historical_coordinator: HildebrandGlowEnergyMonitorDataUpdateCoordinator,
+    meter_id: str,
+    meter_data: dict[str, Any],
+    added: set[tuple[str, str]],
+) -> Iterator[SensorEntity]:
+    """Yield the meter's sensors not yet in added, each bound to the coordinator serving its data."""
+    # Device info for this meter, shared with every other entity of the meter
+    device_info = coordinator.get_device_info(meter_id)
+
+    # Add usage, cost and tariff sensors for each energy type the meter has
+    for description in ALL_DESCRIPTIONS:
+        if meter_data.get(description.has_key, False) and (meter_id, description.key) not in added:
+            added.add((meter_id, description.key))
+            yield HildebrandGlowSensor(
+                coordinator=historical_coordinator if description.historical else coordinator,
+                entity_description=description,
+                meter_id=meter_id,
+                device_info=device_info,
             )
 
-        # Add diagnostic sensors for each meter
-        entities.extend(
-            HildebrandGlowDiagnosticSensor(
+    # Add diagnostic sensors for each meter
+    for description in DIAGNOSTIC_DESCRIPTIONS:
+        if (meter_id, description.key) not in added:
+            added.add((meter_id, description.key))
+            yield HildebrandGlowDiagnosticSensor(
                 coordinator=coordinator,
                 entity_description=description,
                 meter_id=meter_id,
                 device_info=device_info,
             )
-            for description in DIAGNOSTIC_DESCRIPTIONS
-        )
-
-    async_add_entities(entities)
@@ -59,11 +59,6 @@ def __init__(
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{meter_id}_{entity_description.key}"
         self._attr_device_info = device_info
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
-
     @property
     def native_value(self) -> datetime | None:
         """Return the timestamp of the last successful update."""
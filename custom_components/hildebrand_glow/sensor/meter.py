@@ -0,0 +1,60 @@
+"""Meter sensors for hildebrand_glow."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from custom_components.hildebrand_glow.entity import HildebrandGlowEnergyMonitorMeterEntity
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.helpers.device_registry import DeviceInfo
+
+if TYPE_CHECKING:
+    from custom_components.hildebrand_glow.coordinator import HildebrandGlowEnergyMonitorDataUpdateCoordinator
+
+
+@dataclass(frozen=True, kw_only=True)
+class HildebrandGlowSensorEntityDescription(SensorEntityDescription):
+    """Entity description for meter sensors."""
+
+    data_key: str
+    has_key: str  # Meter data flag gating availability, e.g. "has_electricity"
+    include_postal_code: bool = True
+    historical: bool = False  # Served by the hourly historical coordinator
+
+
+class HildebrandGlowSensor(SensorEntity, HildebrandGlowEnergyMonitorMeterEntity):
+    """Meter sensor class for usage, cost and tariff values."""
+
+    entity_description: HildebrandGlowSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HildebrandGlowEnergyMonitorDataUpdateCoordinator,
+        entity_description: HildebrandGlowSensorEntityDescription,
+        meter_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """
+        Initialize the sensor.
+
+        Args:
+            coordinator: The data update coordinator.
+            entity_description: The entity description.
+            meter_id: The virtual entity (meter) ID.
+            device_info: The device info for this meter.
+
+        """
+        # Bound once so updates skip the entity_description lookups
+        self._data_key = entity_description.data_key
+        self._has_key = entity_description.has_key
+        self._include_postal_code = entity_description.include_postal_code
+        # Built once and mutated in place; Home Assistant copies it into each state
+        self._attr_extra_state_attributes: dict[str, Any] = {"meter_id": meter_id}
+        super().__init__(coordinator, entity_description, meter_id, device_info)
+
+    def _refresh_meter_state(self) -> None:
+        """Derive the entity state and postal code attribute from the meter data."""
+        super()._refresh_meter_state()
+        if self._include_postal_code:
+            self._attr_extra_state_attributes["postal_code"] = self._meter_data.get("postal_code")
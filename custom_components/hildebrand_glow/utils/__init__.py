@@ -1,7 +1,13 @@
 """Utils package for hildebrand_glow."""
 
-from .string_helpers import slugify_name, truncate_string
-from .validators import validate_api_response, validate_config_value
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .string_helpers import slugify_name, truncate_string
+    from .validators import validate_api_response, validate_config_value
 
 __all__ = [
     "slugify_name",
@@ -9,3 +15,25 @@
     "validate_api_response",
     "validate_config_value",
 ]
+
+# Submodules are imported on first attribute access (PEP 562) so importing the
+# package does not load helpers the caller never uses
+_LAZY_ATTRIBUTES = {
+    "slugify_name": "string_helpers",
+    "truncate_string": "string_helpers",
+    "validate_api_response": "validators",
+    "validate_config_value": "validators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported helper from its submodule on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
@@ -0,0 +1 @@
+"""Tests for the hildebrand_glow API client."""
@@ -0,0 +1,199 @@
+"""Unit tests for the Glowmarkt API client."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.hildebrand_glow.api.client import (
+    HildebrandGlowEnergyMonitorApiClient,
+    HildebrandGlowEnergyMonitorApiClientAuthenticationError,
+    HildebrandGlowEnergyMonitorApiClientCommunicationError,
+    ResourceSpec,
+)
+
+HOUR_START = datetime(2026, 10, 16, 10, 0, tzinfo=UTC)
+CONSTANT_LOAD_KW = 1.2
+
+
+def _hour(start: datetime) -> int:
+    """Return the timestamp of an hourly bucket start."""
+    return int(start.timestamp())
+
+
+def _response(status: int, body: bytes = b"{}") -> MagicMock:
+    """Build a mocked aiohttp response."""
+    response = MagicMock(status=status, headers={})
+    response.read = AsyncMock(return_value=body)
+    return response
+
+
+def _hourly_series(params: dict[str, Any]) -> dict[str, Any]:
+    """Return an hourly readings response of 1 kWh per hour covering the requested range."""
+    start = datetime.fromisoformat(params["from"]).replace(tzinfo=UTC)
+    end = datetime.fromisoformat(params["to"]).replace(tzinfo=UTC)
+    data = []
+    while start < end:
+        data.append([_hour(start), 1.0])
+        start += timedelta(hours=1)
+    return {"units": "kWh", "data": data}
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Return a mocked aiohttp session."""
+    return MagicMock()
+
+
+@pytest.fixture
+def client(session: MagicMock) -> HildebrandGlowEnergyMonitorApiClient:
+    """
+    Return an API client holding a token that is still valid.
+
+    The client uses __slots__, so tests patch methods on the class rather than the instance.
+    """
+    client = HildebrandGlowEnergyMonitorApiClient("user@example.com", "password", session=session)
+    client._token = "old-token"
+    client._auth_headers["token"] = "old-token"
+    client._token_refresh_at = datetime.now(tz=UTC) + timedelta(hours=1)
+    return client
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("minutes", [5, 15, 25, 35, 59])
+def test_current_from_series_constant_load(minutes: int) -> None:
+    """A constant load reads the same power at every poll within the hour."""
+    series = {
+        "units": "kWh",
+        "data": [
+            [_hour(HOUR_START - timedelta(hours=1)), CONSTANT_LOAD_KW],
+            [_hour(HOUR_START), CONSTANT_LOAD_KW * minutes / 60],
+        ],
+    }
+
+    current = HildebrandGlowEnergyMonitorApiClient._current_from_series(series, HOUR_START + timedelta(minutes=minutes))
+
+    assert current is not None
+    assert current["data"][0][0] == _hour(HOUR_START)
+    # kWh per minute, the shape of a PT1M response
+    assert current["data"][0][1] * 60 == pytest.approx(CONSTANT_LOAD_KW)
+
+
+@pytest.mark.unit
+def test_current_from_series_rejects_previous_hour() -> None:
+    """A point from an hour that has already ended is not current power."""
+    series = {
+        "units": "kWh",
+        "data": [[_hour(HOUR_START - timedelta(hours=1)), CONSTANT_LOAD_KW], [_hour(HOUR_START), None]],
+    }
+
+    assert HildebrandGlowEnergyMonitorApiClient._current_from_series(series, HOUR_START + timedelta(minutes=5)) is None
+
+
+@pytest.mark.unit
+def test_current_from_series_empty() -> None:
+    """A series without data has no current reading."""
+    assert HildebrandGlowEnergyMonitorApiClient._current_from_series({"data": []}, HOUR_START) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("current_pt1m", "expected_periods"), [(True, {"PT1H", "PT1M"}), (False, {"PT1H"})])
+async def test_current_requested_with_series(
+    client: HildebrandGlowEnergyMonitorApiClient, current_pt1m: bool, expected_periods: set[str]
+) -> None:
+    """PT1M readings are fetched alongside the series or not at all, never in a second round trip."""
+    resource = ResourceSpec("resource", "electricity.consumption", is_consumption=True)
+    # On the hour, before the meter has reported the hour in progress
+    now = HOUR_START
+    with patch.object(
+        HildebrandGlowEnergyMonitorApiClient,
+        "_api_request",
+        AsyncMock(side_effect=lambda *_, params, **__: _hourly_series(params)),
+    ) as api_request:
+        fetched = await client._fetch_resource(
+            resource, now, {"today": now.replace(hour=0)}, include_tariff=False, current_pt1m=current_pt1m
+        )
+
+    assert {call.kwargs["params"]["period"] for call in api_request.await_args_list} == expected_periods
+    assert api_request.await_count == len(expected_periods)
+    assert ("current" in fetched) is current_pt1m
+
+
+@pytest.mark.unit
+async def test_week_spanning_two_months(client: HildebrandGlowEnergyMonitorApiClient) -> None:
+    """A week that starts in the previous month is summed from its own start, not the month's."""
+    # Friday 2 October: the week started on Monday 28 September
+    now = datetime(2026, 10, 2, 12, 0, tzinfo=UTC)
+    week_start = datetime(2026, 9, 28, tzinfo=UTC)
+    month_start = datetime(2026, 10, 1, tzinfo=UTC)
+    resource = ResourceSpec("resource", "electricity.consumption", is_consumption=True)
+    with patch.object(
+        HildebrandGlowEnergyMonitorApiClient,
+        "_api_request",
+        AsyncMock(side_effect=lambda *_, params, **__: _hourly_series(params)),
+    ) as api_request:
+        fetched = await client._fetch_resource(
+            resource,
+            now,
+            {"week": week_start, "month": month_start},
+            include_current=False,
+            include_tariff=False,
+        )
+
+    assert api_request.await_count == 1
+    assert api_request.await_args.kwargs["params"]["from"] == "2026-09-28T00:00:00"
+    assert fetched["week"]["data"] == [[_hour(week_start), 4 * 24 + 12]]
+    assert fetched["month"]["data"] == [[_hour(month_start), 24 + 12]]
+
+
+@pytest.mark.unit
+async def test_reauthenticates_after_401(client: HildebrandGlowEnergyMonitorApiClient, session: MagicMock) -> None:
+    """A 401 drops the token, re-authenticates once and retries the request."""
+    session.request = AsyncMock(side_effect=[_response(401), _response(200, b'[{"veId": "ve"}]')])
+
+    async def authenticate() -> str:
+        client._token = "new-token"
+        client._auth_headers["token"] = "new-token"
+        client._token_refresh_at = datetime.now(tz=UTC) + timedelta(hours=1)
+        return "new-token"
+
+    with patch.object(
+        HildebrandGlowEnergyMonitorApiClient, "async_authenticate", AsyncMock(side_effect=authenticate)
+    ) as async_authenticate:
+        result = await client.async_get_virtual_entities()
+
+    assert result == [{"veId": "ve"}]
+    assert async_authenticate.await_count == 1
+    assert session.request.await_count == 2
+    assert client._token == "new-token"
+
+
+@pytest.mark.unit
+async def test_401_after_reauthentication_fails(
+    client: HildebrandGlowEnergyMonitorApiClient, session: MagicMock
+) -> None:
+    """A second 401 with a fresh token is reported as an authentication error."""
+    session.request = AsyncMock(side_effect=[_response(401), _response(401)])
+
+    async def authenticate() -> str:
+        client._token = "new-token"
+        client._token_refresh_at = datetime.now(tz=UTC) + timedelta(hours=1)
+        return "new-token"
+
+    with (
+        patch.object(HildebrandGlowEnergyMonitorApiClient, "async_authenticate", AsyncMock(side_effect=authenticate)),
+        pytest.raises(HildebrandGlowEnergyMonitorApiClientAuthenticationError),
+    ):
+        await client.async_get_virtual_entities()
+
+
+@pytest.mark.unit
+async def test_authenticate_non_json_response(client: HildebrandGlowEnergyMonitorApiClient, session: MagicMock) -> None:
+    """An HTML error page from a proxy is a communication error, not a raw ValueError."""
+    session.post = AsyncMock(return_value=_response(200, b"<html>Bad Gateway</html>"))
+
+    with pytest.raises(HildebrandGlowEnergyMonitorApiClientCommunicationError):
+        await client.async_authenticate()
@@ -0,0 +1,88 @@
+"""Shared fixtures for hildebrand_glow tests."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hildebrand_glow.const import DOMAIN, LOGGER, UPDATE_INTERVAL_HISTORICAL
+from custom_components.hildebrand_glow.coordinator import (
+    HildebrandGlowEnergyMonitorDailyCoordinator,
+    HildebrandGlowEnergyMonitorHistoricalCoordinator,
+)
+from custom_components.hildebrand_glow.data import HildebrandGlowEnergyMonitorData
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+UPDATE_INTERVAL = timedelta(minutes=5)
+
+
+@pytest.fixture
+def mock_api_client() -> MagicMock:
+    """Return a mocked API client whose async_get_data returns no meters."""
+    client = MagicMock()
+    client.async_get_data = AsyncMock(return_value={"meters": {}})
+    return client
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a config entry added to Home Assistant but not set up."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="user@example.com",
+        data={CONF_USERNAME: "user@example.com", CONF_PASSWORD: "password"},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api_client: MagicMock,
+) -> AsyncIterator[HildebrandGlowEnergyMonitorDailyCoordinator]:
+    """Return the daily coordinator, with runtime data wired up as async_setup_entry does."""
+    daily = HildebrandGlowEnergyMonitorDailyCoordinator(
+        hass=hass,
+        logger=LOGGER,
+        name=f"{DOMAIN}_daily",
+        config_entry=config_entry,
+        update_interval=UPDATE_INTERVAL,
+        always_update=False,
+    )
+    historical = HildebrandGlowEnergyMonitorHistoricalCoordinator(
+        hass=hass,
+        logger=LOGGER,
+        name=f"{DOMAIN}_historical",
+        config_entry=config_entry,
+        update_interval=timedelta(minutes=UPDATE_INTERVAL_HISTORICAL),
+        always_update=False,
+    )
+    config_entry.runtime_data = HildebrandGlowEnergyMonitorData(
+        client=mock_api_client,
+        coordinator=daily,
+        historical_coordinator=historical,
+        integration=MagicMock(),
+    )
+    yield daily
+    # Cancel refreshes scheduled by listeners so no timer outlives the test
+    await daily.async_shutdown()
+    await historical.async_shutdown()
+
+
+@pytest.fixture
+def historical_coordinator(
+    coordinator: HildebrandGlowEnergyMonitorDailyCoordinator,
+) -> HildebrandGlowEnergyMonitorHistoricalCoordinator:
+    """Return the historical coordinator created alongside the daily one."""
+    return coordinator.config_entry.runtime_data.historical_coordinator
@@ -0,0 +1,131 @@
+"""Tests for the hildebrand_glow data update coordinators."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.hildebrand_glow.api import HildebrandGlowEnergyMonitorApiClientCommunicationError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from custom_components.hildebrand_glow.coordinator import (
+        HildebrandGlowEnergyMonitorDailyCoordinator,
+        HildebrandGlowEnergyMonitorHistoricalCoordinator,
+    )
+
+METER_ID = "meter-1"
+
+RAW_DATA: dict[str, Any] = {
+    "meters": {
+        METER_ID: {
+            "virtual_entity": {"name": "Home", "postalCode": "AB1 2CD"},
+            "resources": [
+                {"classifier": "electricity.consumption"},
+                {"classifier": "gas.consumption"},
+            ],
+            "readings": {
+                "electricity.consumption_today": {"units": "kWh", "data": [[0, 1.25], [3600, 2.5]]},
+                "electricity.consumption.cost_today": {"units": "pence", "data": [[0, 40.0], [3600, 80.0]]},
+                "electricity.consumption_week": {"units": "kWh", "data": [[0, 20.0]]},
+                "electricity.consumption_month": {"units": "kWh", "data": [[0, 90.0]]},
+            },
+            "tariffs": {
+                "electricity.consumption": {
+                    "data": [{"currentRates": {"rate": 24.5, "standingCharge": 53.35}}],
+                },
+            },
+            "current": {
+                "electricity.consumption": {"units": "kWh", "data": [[0, 0.02]]},
+            },
+        },
+    },
+}
+
+METADATA_KEYS = {"meter_id", "name", "postal_code", "model", "has_electricity", "has_gas"}
+
+
+def _totals_keys(*periods: str) -> set[str]:
+    """Return the usage and cost keys for both energy types over the periods."""
+    return {
+        f"{energy_type}_{measure}_{period}"
+        for energy_type in ("electricity", "gas")
+        for measure in ("usage", "cost")
+        for period in periods
+    }
+
+
+@pytest.mark.integration
+async def test_daily_scope_keys(coordinator: HildebrandGlowEnergyMonitorDailyCoordinator) -> None:
+    """The daily coordinator returns today's totals and current power, but no tariffs."""
+    meter = coordinator._transform_data(RAW_DATA)["meters"][METER_ID]
+
+    assert set(meter) == METADATA_KEYS | _totals_keys("today") | {"electricity_power_current", "gas_power_current"}
+    assert meter["electricity_usage_today"] == 3.75
+    assert meter["electricity_cost_today"] == 1.2
+
+
+@pytest.mark.integration
+async def test_historical_scope_keys(
+    historical_coordinator: HildebrandGlowEnergyMonitorHistoricalCoordinator,
+) -> None:
+    """The historical coordinator returns week and month totals and tariffs, but no current power."""
+    meter = historical_coordinator._transform_data(RAW_DATA)["meters"][METER_ID]
+
+    assert set(meter) == METADATA_KEYS | _totals_keys("week", "month") | {
+        "electricity_rate",
+        "electricity_standing_charge",
+        "gas_rate",
+        "gas_standing_charge",
+    }
+    assert meter["electricity_usage_week"] == 20.0
+    assert meter["electricity_rate"] == 24.5
+    assert meter["electricity_standing_charge"] == 0.53
+
+
+@pytest.mark.integration
+async def test_failure_backoff(
+    coordinator: HildebrandGlowEnergyMonitorDailyCoordinator,
+    mock_api_client: MagicMock,
+) -> None:
+    """Consecutive failures double the retry delay up to an hour, and a success resets it."""
+    mock_api_client.async_get_data.side_effect = HildebrandGlowEnergyMonitorApiClientCommunicationError("boom")
+
+    retry_after = []
+    for _ in range(6):
+        with pytest.raises(UpdateFailed) as exc_info:
+            await coordinator._async_update_data()
+        retry_after.append(exc_info.value.retry_after)
+
+    assert retry_after == [300, 600, 1200, 2400, 3600, 3600]
+
+    mock_api_client.async_get_data.side_effect = None
+    mock_api_client.async_get_data.return_value = RAW_DATA
+    await coordinator._async_update_data()
+
+    mock_api_client.async_get_data.side_effect = HildebrandGlowEnergyMonitorApiClientCommunicationError("boom")
+    with pytest.raises(UpdateFailed) as exc_info:
+        await coordinator._async_update_data()
+    assert exc_info.value.retry_after == 300
+
+
+@pytest.mark.integration
+async def test_unchanged_meter_reuses_transform(
+    historical_coordinator: HildebrandGlowEnergyMonitorHistoricalCoordinator,
+) -> None:
+    """An equal payload returns the previous meter dict instead of rebuilding it."""
+    first = historical_coordinator._transform_data(RAW_DATA)["meters"][METER_ID]
+    second = historical_coordinator._transform_data(deepcopy(RAW_DATA))["meters"][METER_ID]
+
+    assert second is first
+
+    changed = deepcopy(RAW_DATA)
+    changed["meters"][METER_ID]["readings"]["electricity.consumption_week"]["data"] = [[0, 21.0]]
+    third = historical_coordinator._transform_data(changed)["meters"][METER_ID]
+
+    assert third is not first
+    assert third["electricity_usage_week"] == 21.0
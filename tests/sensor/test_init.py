@@ -0,0 +1,70 @@
+"""Tests for the hildebrand_glow sensor platform setup."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.hildebrand_glow.sensor import ALL_DESCRIPTIONS, async_setup_entry
+
+if TYPE_CHECKING:
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.hildebrand_glow.coordinator import (
+        HildebrandGlowEnergyMonitorDailyCoordinator,
+        HildebrandGlowEnergyMonitorHistoricalCoordinator,
+    )
+    from homeassistant.core import HomeAssistant
+
+METER_ID = "meter-1"
+
+
+def _meters(*, has_gas: bool) -> dict[str, Any]:
+    """Return coordinator data for one electricity meter, optionally with gas."""
+    return {
+        "meters": {
+            METER_ID: {
+                "meter_id": METER_ID,
+                "name": "Home",
+                "model": "Electricity Smart Meter",
+                "has_electricity": True,
+                "has_gas": has_gas,
+            },
+        },
+    }
+
+
+def _added_keys(add_entities: MagicMock) -> set[str]:
+    """Return the description keys of the entities passed in the last call."""
+    return {entity.entity_description.key for entity in add_entities.call_args.args[0]}
+
+
+@pytest.mark.integration
+async def test_new_gas_meter_adds_entities_once(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: HildebrandGlowEnergyMonitorDailyCoordinator,
+    historical_coordinator: HildebrandGlowEnergyMonitorHistoricalCoordinator,
+) -> None:
+    """Gas sensors are added when a meter first reports gas, and not again on later updates."""
+    historical_coordinator.async_set_updated_data({"meters": {}})
+    coordinator.async_set_updated_data(_meters(has_gas=False))
+    add_entities = MagicMock()
+
+    await async_setup_entry(hass, config_entry, add_entities)
+
+    assert add_entities.call_count == 1
+    assert not any(key.startswith("gas_") for key in _added_keys(add_entities))
+
+    coordinator.async_set_updated_data(_meters(has_gas=True))
+
+    assert add_entities.call_count == 2
+    assert _added_keys(add_entities) == {
+        description.key for description in ALL_DESCRIPTIONS if description.has_key == "has_gas"
+    }
+
+    coordinator.async_set_updated_data(_meters(has_gas=True))
+
+    assert add_entities.call_count == 2